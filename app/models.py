@@ -1,23 +1,49 @@
-from sqlmodel import SQLModel, Field
+from sqlmodel import SQLModel, Field, Column, DateTime, Index, func, text
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+
+TITLE_MAX_LENGTH = 200
 
 
 # Persistent models (stored in database)
 class Task(SQLModel, table=True):
     __tablename__ = "tasks"  # type: ignore[assignment]
+    __table_args__ = (
+        # Matches the listing order (created_at DESC, id DESC) so it is served by a backward index scan
+        Index("ix_tasks_created_at", "created_at", "id"),
+        # Partial index over pending tasks keeps completion counts index-only
+        Index(
+            "ix_tasks_pending",
+            "completed",
+            postgresql_where=text("completed = false"),
+            sqlite_where=text("completed = 0"),
+        ),
+    )
+    # Load server-generated columns (created_at) back via RETURNING when the row is flushed
+    __mapper_args__ = {"eager_defaults": True}
 
-    id: Optional[int] = Field(default=None, primary_key=True)
-    title: str = Field(max_length=200)
+    id: int | None = Field(default=None, primary_key=True)
+    title: str = Field(max_length=TITLE_MAX_LENGTH)
     completed: bool = Field(default=False)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime | None = Field(
+        default=None, sa_column=Column(DateTime, server_default=func.now(), nullable=False)
+    )
 
 
 # Non-persistent schemas (for validation, forms, API requests/responses)
 class TaskCreate(SQLModel, table=False):
-    title: str = Field(max_length=200)
+    title: str = Field(max_length=TITLE_MAX_LENGTH)
 
 
 class TaskUpdate(SQLModel, table=False):
-    title: Optional[str] = Field(default=None, max_length=200)
-    completed: Optional[bool] = Field(default=None)
+    title: str | None = Field(default=None, max_length=TITLE_MAX_LENGTH)
+    completed: bool | None = Field(default=None)
+
+
+# Read-only rows (for list rendering; no ORM identity map or change tracking)
+@dataclass(slots=True)
+class TaskRow:
+    id: int
+    title: str
+    completed: bool
+    created_at: datetime
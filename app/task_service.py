@@ -1,7 +1,23 @@
+from collections.abc import Sequence
 from typing import Optional
-from sqlmodel import select
+from sqlalchemy import lambda_stmt
+from sqlmodel import select, update, func, case, col, desc, not_
 from app.database import get_session
-from app.models import Task, TaskCreate, TaskUpdate
+from app.models import Task, TaskCreate, TaskRow, TaskUpdate
+
+# Fixed read statements wrapped in lambda_stmt so their cache key and compiled SQL are reused across calls
+_ALL_TASKS = lambda_stmt(lambda: select(Task).order_by(desc(Task.created_at), desc(Task.id)))
+_TASK_STATISTICS = lambda_stmt(
+    lambda: select(func.count(), func.coalesce(func.sum(case((Task.completed, 1), else_=0)), 0))
+)
+# Window aggregates attach the table-wide counts to every row of the ordered listing
+_TASK_ROWS_WITH_STATS = lambda_stmt(
+    lambda: (
+        select(col(Task.id), col(Task.title), col(Task.completed), col(Task.created_at))
+        .add_columns(func.count().over(), func.sum(case((Task.completed, 1), else_=0)).over())
+        .order_by(desc(Task.created_at), desc(Task.id))
+    )
+)
 
 
 class TaskService:
@@ -13,18 +29,15 @@ class TaskService:
         with get_session() as session:
             task = Task(title=task_data.title)
             session.add(task)
+            session.flush()  # id and created_at come back via RETURNING, no follow-up SELECT
             session.commit()
-            session.refresh(task)
             return task
 
     @staticmethod
-    def get_all_tasks() -> list[Task]:
+    def get_all_tasks() -> Sequence[Task]:
         """Get all tasks ordered by creation date (newest first)."""
         with get_session() as session:
-            from sqlmodel import desc
-
-            statement = select(Task).order_by(desc(Task.created_at))
-            return list(session.exec(statement).all())
+            return session.execute(_ALL_TASKS).scalars().all()
 
     @staticmethod
     def get_task_by_id(task_id: int) -> Optional[Task]:
@@ -48,13 +61,24 @@ class TaskService:
 
             session.add(task)
             session.commit()
-            session.refresh(task)
             return task
 
     @staticmethod
     def toggle_task_completion(task_id: int) -> Optional[Task]:
         """Toggle the completion status of a task."""
         with get_session() as session:
+            if session.get_bind().dialect.update_returning:
+                # Flip the flag and read the row back in a single UPDATE ... RETURNING statement
+                statement = (
+                    update(Task).where(col(Task.id) == task_id).values(completed=not_(Task.completed)).returning(Task)
+                )
+                updated = session.execute(statement).scalars().first()
+                if updated is None:
+                    return None
+
+                session.commit()
+                return updated
+
             task = session.get(Task, task_id)
             if task is None:
                 return None
@@ -62,7 +86,6 @@ class TaskService:
             task.completed = not task.completed
             session.add(task)
             session.commit()
-            session.refresh(task)
             return task
 
     @staticmethod
@@ -81,9 +104,20 @@ class TaskService:
     def get_task_statistics() -> dict[str, int]:
         """Get statistics about tasks."""
         with get_session() as session:
-            all_tasks = list(session.exec(select(Task)).all())
-            total = len(all_tasks)
-            completed = sum(1 for task in all_tasks if task.completed)
+            # Aggregate in the database rather than hydrating every row
+            total, completed = session.execute(_TASK_STATISTICS).one()
             pending = total - completed
 
             return {"total": total, "completed": completed, "pending": pending}
+
+    @staticmethod
+    def get_tasks_and_stats() -> tuple[list[TaskRow], dict[str, int]]:
+        """Get all tasks (newest first) together with their statistics in a single session."""
+        with get_session() as session:
+            rows = session.execute(_TASK_ROWS_WITH_STATS).all()
+
+            tasks = [TaskRow(*row[:4]) for row in rows]
+            total, completed = (rows[0][4], rows[0][5]) if rows else (0, 0)
+            pending = total - completed
+
+            return tasks, {"total": total, "completed": completed, "pending": pending}
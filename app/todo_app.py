@@ -1,10 +1,18 @@
 import logging
-from nicegui import ui
+from functools import partial
+from nicegui import run, ui
 from app.task_service import TaskService
-from app.models import TaskCreate, TaskUpdate
+from app.models import TITLE_MAX_LENGTH, TaskCreate, TaskRow, TaskUpdate
 
 logger = logging.getLogger(__name__)
 
+# Task item classes depend only on completion status, so build them once at import time
+CARD_CLASSES_BASE = "p-4 shadow-md rounded-lg hover:shadow-lg transition-all duration-200"
+CARD_CLASSES_DONE = f"{CARD_CLASSES_BASE} bg-green-50 border-l-4 border-green-400"
+CARD_CLASSES_TODO = f"{CARD_CLASSES_BASE} bg-white border-l-4 border-blue-400"
+TITLE_CLASSES_DONE = "text-lg flex-1 line-through text-gray-500"
+TITLE_CLASSES_TODO = "text-lg flex-1 text-gray-800"
+
 
 def create():
     """Create the todo application UI."""
@@ -21,7 +29,7 @@ def create():
     )
 
     @ui.page("/")
-    def todo_page():
+    async def todo_page():
         """Main todo application page."""
 
         # Page header
@@ -46,59 +54,41 @@ def create():
         # Tasks list container
         tasks_container = ui.column().classes("w-full gap-2")
 
-        def create_statistics_cards():
-            """Create or update statistics cards."""
-            stats_container.clear()
-            stats = TaskService.get_task_statistics()
-
-            with stats_container:
-                # Total tasks card
-                with ui.card().classes("p-4 bg-white shadow-md rounded-xl hover:shadow-lg transition-shadow"):
-                    ui.label("Total Tasks").classes("text-sm text-gray-500 uppercase tracking-wider")
-                    ui.label(str(stats["total"])).classes("text-2xl font-bold text-gray-800 mt-1")
-
-                # Completed tasks card
-                with ui.card().classes("p-4 bg-white shadow-md rounded-xl hover:shadow-lg transition-shadow"):
-                    ui.label("Completed").classes("text-sm text-gray-500 uppercase tracking-wider")
-                    ui.label(str(stats["completed"])).classes("text-2xl font-bold text-green-600 mt-1")
-
-                # Pending tasks card
-                with ui.card().classes("p-4 bg-white shadow-md rounded-xl hover:shadow-lg transition-shadow"):
-                    ui.label("Pending").classes("text-sm text-gray-500 uppercase tracking-wider")
-                    ui.label(str(stats["pending"])).classes("text-2xl font-bold text-orange-600 mt-1")
-
-        def create_task_item(task):
+        @ui.refreshable
+        def stats_view(stats: dict[str, int]):
+            """Statistics cards."""
+            # Total tasks card
+            with ui.card().classes("p-4 bg-white shadow-md rounded-xl hover:shadow-lg transition-shadow"):
+                ui.label("Total Tasks").classes("text-sm text-gray-500 uppercase tracking-wider")
+                ui.label(str(stats["total"])).classes("text-2xl font-bold text-gray-800 mt-1")
+
+            # Completed tasks card
+            with ui.card().classes("p-4 bg-white shadow-md rounded-xl hover:shadow-lg transition-shadow"):
+                ui.label("Completed").classes("text-sm text-gray-500 uppercase tracking-wider")
+                ui.label(str(stats["completed"])).classes("text-2xl font-bold text-green-600 mt-1")
+
+            # Pending tasks card
+            with ui.card().classes("p-4 bg-white shadow-md rounded-xl hover:shadow-lg transition-shadow"):
+                ui.label("Pending").classes("text-sm text-gray-500 uppercase tracking-wider")
+                ui.label(str(stats["pending"])).classes("text-2xl font-bold text-orange-600 mt-1")
+
+        def create_task_item(task: TaskRow):
             """Create a task item UI component."""
 
             # Task card styling based on completion status
-            card_classes = "p-4 shadow-md rounded-lg hover:shadow-lg transition-all duration-200"
-            if task.completed:
-                card_classes += " bg-green-50 border-l-4 border-green-400"
-            else:
-                card_classes += " bg-white border-l-4 border-blue-400"
+            card_classes = CARD_CLASSES_DONE if task.completed else CARD_CLASSES_TODO
 
             with ui.card().classes(card_classes):
                 with ui.row().classes("w-full items-center justify-between"):
                     # Task content
                     with ui.row().classes("flex-1 items-center gap-3"):
-                        # Completion checkbox
-                        def make_toggle_handler(task_id: int | None):
-                            def handler(e):
-                                if task_id is not None:
-                                    toggle_task_completion(task_id)
-
-                            return handler
-
-                        ui.checkbox(value=task.completed, on_change=make_toggle_handler(task.id)).classes(
+                        # Completion checkbox (partial binds the id without allocating a closure per task)
+                        ui.checkbox(value=task.completed, on_change=partial(toggle_task_completion, task.id)).classes(
                             "text-primary"
                         )
 
                         # Task title with strikethrough for completed tasks
-                        title_classes = "text-lg flex-1"
-                        if task.completed:
-                            title_classes += " line-through text-gray-500"
-                        else:
-                            title_classes += " text-gray-800"
+                        title_classes = TITLE_CLASSES_DONE if task.completed else TITLE_CLASSES_TODO
 
                         ui.label(task.title).classes(title_classes)
 
@@ -109,76 +99,64 @@ def create():
                     # Action buttons
                     with ui.row().classes("gap-2"):
                         # Edit button
-                        def make_edit_handler(task_id: int | None):
-                            async def handler():
-                                if task_id is not None:
-                                    await edit_task_dialog(task_id)
-
-                            return handler
-
-                        ui.button(icon="edit", on_click=make_edit_handler(task.id)).classes("p-2").props(
+                        ui.button(icon="edit", on_click=partial(edit_task_dialog, task.id)).classes("p-2").props(
                             "flat round color=primary"
                         )
 
                         # Delete button
-                        def make_delete_handler(task_id: int | None):
-                            async def handler():
-                                if task_id is not None:
-                                    await confirm_delete_task(task_id)
-
-                            return handler
-
-                        ui.button(icon="delete", on_click=make_delete_handler(task.id)).classes("p-2").props(
+                        ui.button(icon="delete", on_click=partial(confirm_delete_task, task.id)).classes("p-2").props(
                             "flat round color=negative"
                         )
 
-        def refresh_tasks():
-            """Refresh the tasks list and statistics."""
-            with tasks_container:
-                tasks_container.clear()
-
-            create_statistics_cards()
+        @ui.refreshable
+        def tasks_view(tasks: list[TaskRow]):
+            """Task list, or an empty state when there are no tasks."""
+            if not tasks:
+                with ui.card().classes("p-8 text-center bg-gray-50 rounded-lg"):
+                    ui.icon("inbox", size="4em").classes("text-gray-400 mb-4")
+                    ui.label("No tasks yet").classes("text-xl text-gray-600 mb-2")
+                    ui.label("Add your first task above to get started!").classes("text-gray-500")
+            else:
+                for task in tasks:
+                    create_task_item(task)
 
-            tasks = TaskService.get_all_tasks()
+        async def refresh_tasks():
+            """Refresh the tasks list and statistics."""
+            # Database calls are blocking, so run them off the event loop
+            tasks, stats = await run.io_bound(TaskService.get_tasks_and_stats)
 
-            with tasks_container:
-                if not tasks:
-                    with ui.card().classes("p-8 text-center bg-gray-50 rounded-lg"):
-                        ui.icon("inbox", size="4em").classes("text-gray-400 mb-4")
-                        ui.label("No tasks yet").classes("text-xl text-gray-600 mb-2")
-                        ui.label("Add your first task above to get started!").classes("text-gray-500")
-                else:
-                    for task in tasks:
-                        create_task_item(task)
+            stats_view.refresh(stats)
+            tasks_view.refresh(tasks)
 
-        def add_task():
+        async def add_task():
             """Add a new task."""
             title = task_input.value
             if not title or not title.strip():
                 ui.notify("Please enter a task title", type="warning")
                 return
+            if len(title.strip()) > TITLE_MAX_LENGTH:
+                ui.notify(f"Task title must be at most {TITLE_MAX_LENGTH} characters", type="warning")
+                return
 
             try:
-                TaskService.create_task(TaskCreate(title=title.strip()))
+                # The title length is the only TaskCreate constraint and was checked above, so skip re-validation
+                task_data = TaskCreate.model_construct(title=title.strip())
+                await run.io_bound(TaskService.create_task, task_data)
                 task_input.set_value("")
-                refresh_tasks()
+                await refresh_tasks()
                 ui.notify("Task added successfully!", type="positive")
             except Exception as e:
                 logger.error(f"Error adding task: {str(e)}")
                 ui.notify(f"Error adding task: {str(e)}", type="negative")
 
-        def toggle_task_completion(task_id: int):
+        async def toggle_task_completion(task_id: int):
             """Toggle task completion status."""
-            if task_id is None:
-                ui.notify("Invalid task ID", type="warning")
-                return
-
             try:
-                updated_task = TaskService.toggle_task_completion(task_id)
+                updated_task = await run.io_bound(TaskService.toggle_task_completion, task_id)
                 if updated_task:
                     status = "completed" if updated_task.completed else "pending"
                     ui.notify(f"Task marked as {status}", type="positive")
-                    refresh_tasks()
+                    await refresh_tasks()
                 else:
                     ui.notify("Task not found", type="warning")
             except Exception as e:
@@ -187,11 +165,7 @@ def create():
 
         async def edit_task_dialog(task_id: int):
             """Show edit task dialog."""
-            if task_id is None:
-                ui.notify("Invalid task ID", type="warning")
-                return
-
-            task = TaskService.get_task_by_id(task_id)
+            task = await run.io_bound(TaskService.get_task_by_id, task_id)
             if task is None:
                 ui.notify("Task not found", type="warning")
                 return
@@ -219,13 +193,19 @@ def create():
                 if not new_title or not new_title.strip():
                     ui.notify("Please enter a task title", type="warning")
                     return
+                if len(new_title.strip()) > TITLE_MAX_LENGTH:
+                    ui.notify(f"Task title must be at most {TITLE_MAX_LENGTH} characters", type="warning")
+                    return
 
                 try:
-                    update_data = TaskUpdate(title=new_title.strip(), completed=completed_checkbox.value)
-                    updated_task = TaskService.update_task(task_id, update_data)
+                    # Title length was checked above and the checkbox always yields a bool, so skip re-validation
+                    update_data = TaskUpdate.model_construct(
+                        title=new_title.strip(), completed=completed_checkbox.value
+                    )
+                    updated_task = await run.io_bound(TaskService.update_task, task_id, update_data)
                     if updated_task:
                         ui.notify("Task updated successfully!", type="positive")
-                        refresh_tasks()
+                        await refresh_tasks()
                     else:
                         ui.notify("Task not found", type="warning")
                 except Exception as e:
@@ -234,11 +214,7 @@ def create():
 
         async def confirm_delete_task(task_id: int):
             """Show delete confirmation dialog."""
-            if task_id is None:
-                ui.notify("Invalid task ID", type="warning")
-                return
-
-            task = TaskService.get_task_by_id(task_id)
+            task = await run.io_bound(TaskService.get_task_by_id, task_id)
             if task is None:
                 ui.notify("Task not found", type="warning")
                 return
@@ -256,10 +232,10 @@ def create():
 
             if result == "delete":
                 try:
-                    success = TaskService.delete_task(task_id)
+                    success = await run.io_bound(TaskService.delete_task, task_id)
                     if success:
                         ui.notify("Task deleted successfully!", type="positive")
-                        refresh_tasks()
+                        await refresh_tasks()
                     else:
                         ui.notify("Task not found", type="warning")
                 except Exception as e:
@@ -267,7 +243,11 @@ def create():
                     ui.notify(f"Error deleting task: {str(e)}", type="negative")
 
         # Handle Enter key in task input
-        task_input.on("keydown.enter", lambda: add_task())
+        task_input.on("keydown.enter", add_task)
 
         # Initial load
-        refresh_tasks()
+        tasks, stats = await run.io_bound(TaskService.get_tasks_and_stats)
+        with stats_container:
+            stats_view(stats)
+        with tasks_container:
+            tasks_view(tasks)
@@ -0,0 +1,104 @@
+import pytest
+from sqlalchemy import Engine, create_engine, inspect
+from sqlalchemy.exc import IntegrityError
+
+from app.database import _upgrade_tasks_table
+
+# tasks as created by the first release: no created_at default and no indexes
+BASELINE_TASKS_DDL = (
+    "CREATE TABLE tasks (id INTEGER NOT NULL, title VARCHAR(200) NOT NULL, completed BOOLEAN NOT NULL, "
+    "created_at DATETIME NOT NULL, PRIMARY KEY (id))"
+)
+
+
+@pytest.fixture()
+def sqlite_engine(tmp_path):
+    """A file-backed SQLite engine isolated from the app's configured database."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'upgrade.db'}")
+    yield engine
+    engine.dispose()
+
+
+def _run_upgrade(engine: Engine) -> None:
+    with engine.begin() as conn:
+        _upgrade_tasks_table(conn)
+
+
+def _rows(engine: Engine, table: str = "tasks") -> list[tuple]:
+    with engine.connect() as conn:
+        result = conn.exec_driver_sql(f"SELECT id, title, completed, created_at FROM {table} ORDER BY id")
+        return [tuple(row) for row in result]
+
+
+def _seed(engine: Engine, *statements: str) -> None:
+    with engine.begin() as conn:
+        for statement in statements:
+            conn.exec_driver_sql(statement)
+
+
+class TestUpgradeTasksTable:
+    def test_upgrade_baseline_table(self, sqlite_engine):
+        """Test upgrading a baseline table keeps its rows and adds the created_at default and indexes."""
+        _seed(
+            sqlite_engine,
+            BASELINE_TASKS_DDL,
+            "INSERT INTO tasks VALUES (1, 'First', 0, '2024-01-01 10:00:00'), (2, 'Second', 1, '2024-01-02 10:00:00')",
+        )
+        _run_upgrade(sqlite_engine)
+
+        assert _rows(sqlite_engine) == [
+            (1, "First", 0, "2024-01-01 10:00:00"),
+            (2, "Second", 1, "2024-01-02 10:00:00"),
+        ]
+        inspector = inspect(sqlite_engine)
+        created_at = next(column for column in inspector.get_columns("tasks") if column["name"] == "created_at")
+        assert created_at["default"] is not None
+        assert {index["name"] for index in inspector.get_indexes("tasks")} == {
+            "ix_tasks_created_at",
+            "ix_tasks_pending",
+        }
+        assert "_tasks_old" not in inspector.get_table_names()
+
+        # Running again is a no-op
+        _run_upgrade(sqlite_engine)
+        assert len(_rows(sqlite_engine)) == 2
+
+    def test_failed_copy_leaves_original_table(self, sqlite_engine):
+        """Test a rebuild that fails mid-copy rolls back to the untouched original table."""
+        _seed(
+            sqlite_engine,
+            BASELINE_TASKS_DDL.replace("created_at DATETIME NOT NULL", "created_at DATETIME"),
+            "INSERT INTO tasks VALUES (1, 'Dated', 0, '2024-01-01 10:00:00'), (2, 'Undated', 0, NULL)",
+        )
+        with pytest.raises(IntegrityError):
+            _run_upgrade(sqlite_engine)
+
+        assert inspect(sqlite_engine).get_table_names() == ["tasks"]
+        assert _rows(sqlite_engine) == [(1, "Dated", 0, "2024-01-01 10:00:00"), (2, "Undated", 0, None)]
+
+    def test_recovers_interrupted_rebuild(self, sqlite_engine):
+        """Test a _tasks_old left by an interrupted rebuild is restored and upgraded when tasks is empty."""
+        _seed(
+            sqlite_engine,
+            BASELINE_TASKS_DDL.replace("tasks", "_tasks_old"),
+            "INSERT INTO _tasks_old VALUES (1, 'Survivor', 0, '2024-01-01 10:00:00')",
+            BASELINE_TASKS_DDL,
+        )
+        _run_upgrade(sqlite_engine)
+
+        assert inspect(sqlite_engine).get_table_names() == ["tasks"]
+        assert _rows(sqlite_engine) == [(1, "Survivor", 0, "2024-01-01 10:00:00")]
+
+    def test_interrupted_rebuild_with_data_in_both_tables_fails(self, sqlite_engine):
+        """Test the upgrade refuses to pick between two populated tables."""
+        _seed(
+            sqlite_engine,
+            BASELINE_TASKS_DDL.replace("tasks", "_tasks_old"),
+            "INSERT INTO _tasks_old VALUES (1, 'Old', 0, '2024-01-01 10:00:00')",
+            BASELINE_TASKS_DDL,
+            "INSERT INTO tasks VALUES (2, 'New', 0, '2024-01-02 10:00:00')",
+        )
+        with pytest.raises(RuntimeError, match="_tasks_old"):
+            _run_upgrade(sqlite_engine)
+
+        assert sorted(inspect(sqlite_engine).get_table_names()) == ["_tasks_old", "tasks"]
@@ -1,15 +1,49 @@
 import pytest
+from datetime import datetime
+from sqlalchemy import event
 from app.task_service import TaskService
-from app.models import TaskCreate, TaskUpdate
-from app.database import reset_db
+from app.models import Task, TaskCreate, TaskUpdate
+from app.database import ENGINE, get_session, reset_db, set_session_bind
 
 
-@pytest.fixture()
-def clean_db():
-    """Provide a clean database for each test."""
+@pytest.fixture(scope="session")
+def engine():
+    """Create the schema once for the whole test session."""
     reset_db()
+    yield ENGINE
+
+
+@pytest.fixture()
+def clean_db(engine):
+    """Run each test inside an outer transaction that is rolled back afterwards."""
+    connection = engine.connect()
+    is_sqlite = engine.dialect.name == "sqlite"
+    dbapi_connection = connection.connection.driver_connection
+    previous_isolation_level = getattr(dbapi_connection, "isolation_level", None)
+    if is_sqlite:
+        # pysqlite's implicit transaction handling breaks SAVEPOINT; use SQLAlchemy's recipe of emitting BEGIN ourselves
+        dbapi_connection.isolation_level = None
+        event.listen(connection, "begin", lambda conn: conn.exec_driver_sql("BEGIN"))
+    transaction = connection.begin()
+
+    # Service commits only release savepoints, so the outer rollback discards all test data
+    set_session_bind(connection)
     yield
-    reset_db()
+    set_session_bind(None)
+    transaction.rollback()
+    if is_sqlite:
+        dbapi_connection.isolation_level = previous_isolation_level
+    connection.close()
+
+
+def _bulk_create(titles: list[str], completed: list[bool] | None = None) -> list[Task]:
+    """Insert several tasks with a single commit, bypassing the per-task service round-trips."""
+    flags = completed if completed is not None else [False] * len(titles)
+    with get_session() as session:
+        tasks = [Task(title=title, completed=done) for title, done in zip(titles, flags, strict=True)]
+        session.add_all(tasks)
+        session.commit()
+    return tasks
 
 
 class TestTaskService:
@@ -168,16 +202,10 @@ class TestTaskService:
     def test_get_task_statistics_mixed_tasks(self, clean_db):
         """Test statistics with mixed completed and pending tasks."""
         # Create tasks with different completion states
-        TaskService.create_task(TaskCreate(title="Pending Task 1"))
-        task2 = TaskService.create_task(TaskCreate(title="Completed Task 1"))
-        task3 = TaskService.create_task(TaskCreate(title="Completed Task 2"))
-        TaskService.create_task(TaskCreate(title="Pending Task 2"))
-
-        # Mark some as completed
-        if task2.id is not None:
-            TaskService.update_task(task2.id, TaskUpdate(completed=True))
-        if task3.id is not None:
-            TaskService.update_task(task3.id, TaskUpdate(completed=True))
+        _bulk_create(
+            ["Pending Task 1", "Completed Task 1", "Completed Task 2", "Pending Task 2"],
+            [False, True, True, False],
+        )
 
         stats = TaskService.get_task_statistics()
 
@@ -186,14 +214,7 @@ class TestTaskService:
 
     def test_get_task_statistics_all_completed(self, clean_db):
         """Test statistics when all tasks are completed."""
-        task1 = TaskService.create_task(TaskCreate(title="Task 1"))
-        task2 = TaskService.create_task(TaskCreate(title="Task 2"))
-
-        # Mark all as completed
-        if task1.id is not None:
-            TaskService.update_task(task1.id, TaskUpdate(completed=True))
-        if task2.id is not None:
-            TaskService.update_task(task2.id, TaskUpdate(completed=True))
+        _bulk_create(["Task 1", "Task 2"], [True, True])
 
         stats = TaskService.get_task_statistics()
 
@@ -202,15 +223,34 @@ class TestTaskService:
 
     def test_get_task_statistics_all_pending(self, clean_db):
         """Test statistics when all tasks are pending."""
-        TaskService.create_task(TaskCreate(title="Pending Task 1"))
-        TaskService.create_task(TaskCreate(title="Pending Task 2"))
-        TaskService.create_task(TaskCreate(title="Pending Task 3"))
+        _bulk_create(["Pending Task 1", "Pending Task 2", "Pending Task 3"])
 
         stats = TaskService.get_task_statistics()
 
         expected = {"total": 3, "completed": 0, "pending": 3}
         assert stats == expected
 
+    def test_get_tasks_and_stats_empty(self, clean_db):
+        """Test combined tasks and statistics when no tasks exist."""
+        tasks, stats = TaskService.get_tasks_and_stats()
+
+        assert tasks == []
+        assert stats == {"total": 0, "completed": 0, "pending": 0}
+
+    def test_get_tasks_and_stats_with_data(self, clean_db):
+        """Test combined tasks and statistics match the individual queries."""
+        task1 = TaskService.create_task(TaskCreate(title="First Task"))
+        TaskService.create_task(TaskCreate(title="Second Task"))
+
+        if task1.id is not None:
+            TaskService.update_task(task1.id, TaskUpdate(completed=True))
+
+        tasks, stats = TaskService.get_tasks_and_stats()
+
+        assert [task.id for task in tasks] == [task.id for task in TaskService.get_all_tasks()]
+        assert stats == TaskService.get_task_statistics()
+        assert stats == {"total": 2, "completed": 1, "pending": 1}
+
     def test_task_ordering(self, clean_db):
         """Test that tasks are returned in creation order (newest first)."""
         # Create tasks in sequence
@@ -226,6 +266,20 @@ class TestTaskService:
         assert tasks[1].title == "Second Task"
         assert tasks[2].title == "First Task"
 
+    def test_task_ordering_by_created_at(self, clean_db):
+        """Test that ordering follows created_at, not insertion (id) order."""
+        with get_session() as session:
+            session.add(Task(title="Newest", created_at=datetime(2024, 1, 3)))
+            session.add(Task(title="Oldest", created_at=datetime(2024, 1, 1)))
+            session.add(Task(title="Middle", created_at=datetime(2024, 1, 2)))
+            session.commit()
+
+        tasks = TaskService.get_all_tasks()
+        rows, _ = TaskService.get_tasks_and_stats()
+
+        assert [task.title for task in tasks] == ["Newest", "Middle", "Oldest"]
+        assert [row.title for row in rows] == ["Newest", "Middle", "Oldest"]
+
     def test_none_handling_in_update(self, clean_db):
         """Test that None values in TaskUpdate don't overwrite existing data."""
         created_task = TaskService.create_task(TaskCreate(title="Original Title"))